@@ -24,7 +24,9 @@ from shapely.geometry import MultiPoint, Point
 from .constants import DATA_DIR
 
 
-def calculate_dispersion(points: gpd.GeoSeries) -> Tuple[Point, float]:
+def calculate_dispersion(
+    points: gpd.GeoSeries, weights: Optional[pd.Series] = None
+) -> Tuple[Point, float]:
     """Calculates the geographic dispersion of a set of points from
     their mean center. To accurately calculate the mean center
     and the distance between points, it is necessary to first
@@ -36,6 +38,10 @@ def calculate_dispersion(points: gpd.GeoSeries) -> Tuple[Point, float]:
     Args:
         points (`gpd.GeoSeries`): The set of points.
 
+        weights (`pd.Series`): The optional number of observations
+            (e.g., visits) at each point. Defaults to `None`, in
+            which case every point is weighted equally.
+
     Returns:
         ((`Point`, `float`)): A two-item tuple consisting of the
             mean center as a Shapely `Point` instance and the
@@ -50,13 +56,21 @@ def calculate_dispersion(points: gpd.GeoSeries) -> Tuple[Point, float]:
     # centrography.std_distance expects numeric inputs
     x, y = utm_points.x, utm_points.y
 
-    # Calculate the standard distance in the UTM projection
-    std_distance = centrography.std_distance(np.vstack((x, y)).T)
+    # Calculate the standard distance and mean center point
+    # in the UTM projection, weighting points if indicated
+    if weights is None:
+        std_distance = centrography.std_distance(np.vstack((x, y)).T)
+        center_utm = MultiPoint(utm_points.tolist()).centroid
+    else:
+        mean_x = np.average(x, weights=weights)
+        mean_y = np.average(y, weights=weights)
+        std_distance = np.sqrt(
+            np.average((x - mean_x) ** 2 + (y - mean_y) ** 2, weights=weights)
+        )
+        center_utm = Point(mean_x, mean_y)
 
-    # Calculate mean center point
-    multipoint_geom_utm = MultiPoint(utm_points.tolist())
     mean_center = (
-        gpd.GeoSeries(data=[multipoint_geom_utm.centroid])
+        gpd.GeoSeries(data=[center_utm])
         .set_crs(utm_crs)
         .to_crs(original_crs)
         .iloc[0]
@@ -72,6 +86,7 @@ def draw_hexbins(
     figsize: Tuple[int, int] = (16, 12),
     zoom: int = 12,
     output_file_name: Optional[str] = None,
+    weight_col: Optional[str] = None,
 ) -> None:
     """Renders a static map that spatially bins the points in
     the GeoDataFrame by location and then shades the bins on a
@@ -98,6 +113,11 @@ def draw_hexbins(
             output file to write. Defaults to `None`, which
             indicates that no file should be written.
 
+        weight_col (`str`): The name of an optional column holding
+            the number of observations at each point. If provided,
+            bins are shaded by the sum of weights rather than the
+            number of points. Defaults to `None`.
+
     Returns:
         `None`
     """
@@ -108,6 +128,8 @@ def draw_hexbins(
     hxb = ax.hexbin(
         gdf[lon_col],
         gdf[lat_col],
+        C=gdf[weight_col] if weight_col else None,
+        reduce_C_function=np.sum,
         gridsize=50,
         cmap="viridis_r",
         alpha=0.4,
@@ -134,7 +156,13 @@ def draw_hexbins(
     plt.show()
 
 
-def draw_scatterplot(gdf: gpd.GeoDataFrame, lat_col: str, lon_col: str) -> None:
+def draw_scatterplot(
+    gdf: gpd.GeoDataFrame,
+    lat_col: str,
+    lon_col: str,
+    weight_col: Optional[str] = None,
+    bins: int = 50,
+) -> None:
     """Renders a static map of the points in the GeoDataFrame.
 
     Args:
@@ -146,10 +174,32 @@ def draw_scatterplot(gdf: gpd.GeoDataFrame, lat_col: str, lon_col: str) -> None:
 
         lon_col (`str`): The name of the longitude column.
 
+        weight_col (`str`): The name of an optional column holding
+            the number of observations at each point, used to weight
+            the marginal histograms. Defaults to `None`.
+
+        bins (`int`): The number of bins in each marginal histogram
+            when weighted, as weights cannot be used to estimate the
+            number of bins automatically. Defaults to 50.
+
     Returns:
         `None`
     """
-    joint_axes = sns.jointplot(x=lon_col, y=lat_col, data=gdf, s=0.5, height=10)
+    # Weight marginal histograms by values, as they are drawn from
+    # vectors rather than the data frame and cannot resolve a column name
+    marginal_kws = (
+        {"weights": gdf[weight_col].to_numpy(), "bins": bins}
+        if weight_col
+        else None
+    )
+    joint_axes = sns.jointplot(
+        x=lon_col,
+        y=lat_col,
+        data=gdf,
+        s=0.5,
+        height=10,
+        marginal_kws=marginal_kws,
+    )
     ctx.add_basemap(
         joint_axes.ax_joint,
         crs=gdf.crs,
@@ -163,6 +213,7 @@ def draw_standard_deviational_ellipse(
     mean_center: Point,
     figsize: Tuple[int, int] = (16, 12),
     output_file_name: Optional[str] = None,
+    weights: Optional[pd.Series] = None,
 ) -> None:
     """Plot a standard deviational ellipse for geographic
     data to evaluate dispersion. If an output file name is
@@ -182,18 +233,45 @@ def draw_standard_deviational_ellipse(
             output file to write. Defaults to `None`, which
             indicates that no file should be written.
 
+        weights (`pd.Series`): The optional number of observations
+            (e.g., visits) at each point. Defaults to `None`, in
+            which case every point is weighted equally.
+
     Returns:
         `None`
     """
-    # Compute the axes and rotation
-    major, minor, rotation = centrography.ellipse([(p.x, p.y) for p in points])
+    # Compute the axes and rotation, weighting points if indicated.
+    # The weighted form generalizes `centrography.ellipse` by treating
+    # each point as repeated by its weight, without materializing those
+    # repeated points.
+    x, y = points.x.to_numpy(), points.y.to_numpy()
+    if weights is None:
+        major, minor, rotation = centrography.ellipse(np.column_stack((x, y)))
+    else:
+        w = np.asarray(weights, dtype=float)
+        xd = x - np.average(x, weights=w)
+        yd = y - np.average(y, weights=w)
+        xss = (w * xd * xd).sum()
+        yss = (w * yd * yd).sum()
+        cv = (w * xd * yd).sum()
+        rotation = np.arctan(
+            ((xss - yss) + np.sqrt((xss - yss) ** 2 + 4 * cv**2)) / (2 * cv)
+        )
+        cos_theta, sin_theta = np.cos(rotation), np.sin(rotation)
+        n_2 = w.sum() - 2
+        major = np.sqrt(
+            (2 * w * (xd * cos_theta - yd * sin_theta) ** 2).sum() / n_2
+        )
+        minor = np.sqrt(
+            (2 * w * (xd * sin_theta - yd * cos_theta) ** 2).sum() / n_2
+        )
 
     # Set up figure and axis
     _, ax = plt.subplots(1, figsize=figsize, dpi=100)
 
     # Plot points
     xy = (mean_center.x, mean_center.y)
-    ax.scatter(points.x, points.y, s=0.5)
+    ax.scatter(x, y, s=0.5)
     ax.scatter(*xy, color="red", marker="x", label="Mean Center")
     ax.scatter(*xy, color="limegreen", marker="o", label="Median Center")
 
@@ -2,9 +2,11 @@
 """
 
 # Standard library imports
+import functools
 import itertools
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 # Third-party imports
@@ -20,6 +22,7 @@ import seaborn as sns
 from IPython.core.display import HTML
 from IPython.display import display
 from matplotlib.lines import Line2D
+from requests.adapters import HTTPAdapter
 
 # Application imports
 from .constants import DATA_DIR, FOOT_TRAFFIC_DIR
@@ -34,7 +37,6 @@ SAFEGRAPH_RELEVANT_COLUMNS = [
     "date_range_start",
     "date_range_end",
     "raw_visit_counts",
-    "raw_visitor_counts",
     "related_same_day_brand",
 ]
 
@@ -85,67 +87,90 @@ def summarize_column_ranges(df: pd.DataFrame) -> None:
         display(df.query(f"{col} == {col}")[col].agg(["min", "max"]))
 
 
-def explode_dataset(df: pd.DataFrame) -> gpd.GeoDataFrame:
-    """Explodes the SafeGraph data so every row represents
-    a single visit at a location, rather than a total of
-    visits in a particular month at a location, and then
-    casts the dataset to a GeoDataFrame with a CRS of
-    EPSG:4326.
+def explode_dataset(df: pd.DataFrame) -> pd.DataFrame:
+    """Reshapes the SafeGraph data so every row represents the
+    visits at a location in a particular month, weighted by
+    the number of visits. Rows without any visits are dropped.
+    Coordinates are kept as plain numeric columns; use `to_geodf`
+    to build point geometries when a GeoDataFrame is required and
+    `expand_visits` to materialize one row per visit for callers
+    that cannot use weights.
 
     Args:
         df (`pd.DataFrame`): The input DataFrame.
 
     Returns:
-        (`gpd.GeoDataFrame`): The transformed data.
+        (`pd.DataFrame`): The transformed data, with the
+            visit count stored in a "weight" column.
     """
-    # Subset DataFrame
-    subset_df = df[SAFEGRAPH_RELEVANT_COLUMNS].copy()
+    # Subset DataFrame, storing coordinates as single-precision floats
+    subset_df = df[["date_range_start", "date_range_end"]].copy()
+    subset_df["latitude"] = df["latitude"].astype("float32")
+    subset_df["longitude"] = df["longitude"].astype("float32")
 
     # Fill NaNs in the raw_visit_counts column with zero
     # and make all entries in that column integers
-    subset_df["raw_visit_counts"] = (
-        pd.to_numeric(subset_df["raw_visit_counts"], errors="coerce")
+    subset_df["weight"] = (
+        pd.to_numeric(df["raw_visit_counts"], errors="coerce")
         .fillna(0)
-        .astype(int)
+        .astype("int32")
     )
 
-    # Use repeat to expand the DataFrame
-    subset_df = subset_df.reset_index(drop=True)
-    indices = subset_df.index.repeat(subset_df["raw_visit_counts"])
-    expanded_df = subset_df.loc[indices].reset_index(drop=True)
+    # Drop locations without visits, which would not have produced
+    # any rows in a visit-level dataset, as well as locations with
+    # missing or infinite coordinates
+    coords = subset_df[["latitude", "longitude"]].to_numpy()
+    mask = np.isfinite(coords).all(axis=1) & (subset_df["weight"] > 0)
+    return subset_df[mask].reset_index(drop=True)
 
-    # Assert that the number of rows is equal to the sum of raw visit counts
-    assert len(expanded_df) == subset_df["raw_visit_counts"].sum()
 
-    # Check expanded_df for missing or infinite values and drop if necessary
-    expanded_df = expanded_df.dropna(subset=["longitude", "latitude"])
-    expanded_df = expanded_df[
-        (expanded_df["longitude"] != np.inf)
-        & (expanded_df["latitude"] != np.inf)
-    ]
-    expanded_df = expanded_df[
-        (expanded_df["longitude"] != -np.inf)
-        & (expanded_df["latitude"] != -np.inf)
-    ]
+def to_geodf(
+    df: pd.DataFrame,
+    lat_col: str = "latitude",
+    lon_col: str = "longitude",
+) -> gpd.GeoDataFrame:
+    """Casts a DataFrame with latitude and longitude columns,
+    such as the output of `explode_dataset`, to a GeoDataFrame
+    of points with a CRS of EPSG:4326.
 
-    # Convert to GeoDataFrame and set CRS
-    gdf = gpd.GeoDataFrame(
-        expanded_df,
-        geometry=gpd.points_from_xy(
-            x=expanded_df["longitude"], y=expanded_df["latitude"]
-        ),
+    Args:
+        df (`pd.DataFrame`): The input DataFrame.
+
+        lat_col (`str`): The name of the latitude column.
+            Defaults to "latitude".
+
+        lon_col (`str`): The name of the longitude column.
+            Defaults to "longitude".
+
+    Returns:
+        (`gpd.GeoDataFrame`): The data with a point geometry column.
+    """
+    return gpd.GeoDataFrame(
+        df,
+        geometry=gpd.points_from_xy(x=df[lon_col], y=df[lat_col]),
         crs="EPSG:4326",
     )
 
-    return gdf[
-        [
-            "date_range_start",
-            "date_range_end",
-            "latitude",
-            "longitude",
-            "geometry",
-        ]
-    ]
+
+def expand_visits(df: pd.DataFrame, weight_col: str = "weight") -> pd.DataFrame:
+    """Repeats each row of a weighted dataset, such as the output
+    of `explode_dataset`, by its weight so that every row
+    represents a single visit. Intended only for analyses that
+    cannot accept weights (e.g., HDBSCAN clustering), as the
+    result grows with the total number of visits.
+
+    Args:
+        df (`pd.DataFrame`): The weighted dataset.
+
+        weight_col (`str`): The name of the column holding the
+            number of visits per row. Defaults to "weight".
+
+    Returns:
+        (`pd.DataFrame`): The visit-level data, of the same type
+            as the input, without the weight column.
+    """
+    indices = df.index.repeat(df[weight_col])
+    return df.loc[indices].drop(columns=weight_col).reset_index(drop=True)
 
 
 def get_top_location_categories(df: pd.DataFrame, n: int = 20) -> None:
@@ -201,6 +226,26 @@ def find_haversine_distance(lat1, lon1, lat2, lon2) -> float:
     return distance
 
 
+@functools.lru_cache(maxsize=10_000)
+def _parse_related_brands(related_same_day_brand: Optional[str]) -> dict:
+    """Parses a Safegraph "related_same_day_brand" JSON string into a
+    dictionary of brand names and visit counts. Results are cached,
+    as the same string frequently repeats across rows, so callers
+    must not mutate the returned dictionary.
+
+    Args:
+        related_same_day_brand (`str`): The raw JSON string, if any.
+
+    Returns:
+        (`dict`): The related brands, or an empty dictionary if
+            the value is missing or cannot be parsed.
+    """
+    try:
+        return json.loads(related_same_day_brand)
+    except (TypeError, json.JSONDecodeError):
+        return {}
+
+
 def get_top_locations_with_related_brands(
     data: pd.DataFrame, n: int = 10
 ) -> pd.DataFrame:
@@ -224,127 +269,167 @@ def get_top_locations_with_related_brands(
     ).drop_duplicates(subset="safegraph_place_id")
     top_visited = top_visited.head(n)
 
-    results = []
-
-    for _, business in top_visited.iterrows():
-        # Parse the JSON data in 'related_same_day_brand'
-        try:
-            related_brands = json.loads(business["related_same_day_brand"])
-        except json.JSONDecodeError:
-            related_brands = {}
-
-        # Get highest correlation same day brand per high foot traffic business
-        related_brands_df = pd.DataFrame(
-            list(related_brands.items()), columns=["Brand", "Count"]
+    # Parse the JSON data in 'related_same_day_brand' and
+    # explode it into one row per business and related brand
+    related_brands = top_visited[
+        ["safegraph_place_id", "location_name", "latitude", "longitude"]
+    ].copy()
+    related_brands["related"] = top_visited["related_same_day_brand"].map(
+        lambda b: list(_parse_related_brands(b).items())
+    )
+    related_brands = related_brands.explode("related").dropna(
+        subset=["related"]
+    )
+    related_brands["Related Brand"] = related_brands["related"].str[0]
+    related_brands["Related Brand Correlation"] = pd.to_numeric(
+        related_brands["related"].str[1]
+    )
+    related_brands = related_brands.reset_index(drop=True)
+
+    # Get highest correlation same day brand per high foot traffic business
+    top_related = related_brands.loc[
+        related_brands.groupby("safegraph_place_id", sort=False)[
+            "Related Brand Correlation"
+        ].idxmax()
+    ].drop(columns="related")
+
+    # Find all locations of each related brand
+    brand_locations = (
+        data[["location_name", "latitude", "longitude"]]
+        .drop_duplicates()
+        .rename(
+            columns={
+                "location_name": "Related Brand",
+                "latitude": "Related Brand Latitude",
+                "longitude": "Related Brand Longitude",
+            }
         )
-        top_related = related_brands_df.sort_values(
-            by="Count", ascending=False
-        ).head(1)
-
-        for _, row in top_related.iterrows():
-            # Find all locations of the related brand
-            related_brand_locations = data[
-                data["location_name"] == row["Brand"]
-            ]
-
-            related_brand_locations = related_brand_locations.copy()
-
-            # Calculate the distance to each related brand location
-            related_brand_locations.loc[
-                :, "distance"
-            ] = related_brand_locations.apply(
-                lambda x: find_haversine_distance(
-                    business["latitude"],
-                    business["longitude"],
-                    x["latitude"],
-                    x["longitude"],
-                ),
-                axis=1,
-            )
+    )
+    candidates = top_related.merge(brand_locations, on="Related Brand")
+
+    # Calculate the distance to each related brand location
+    candidates["Distance to Related Brand (km)"] = find_haversine_distance(
+        candidates["latitude"],
+        candidates["longitude"],
+        candidates["Related Brand Latitude"],
+        candidates["Related Brand Longitude"],
+    )
+    candidates = candidates.dropna(subset=["Distance to Related Brand (km)"])
 
-            # Find the nearest related brand location
-            nearest_related_brand = related_brand_locations.loc[
-                related_brand_locations["distance"].idxmin()
-            ]
-
-            result = {
-                "Safegraph Place ID": business["safegraph_place_id"],
-                "High Traffic Location": business["location_name"],
-                "High Traffic Latitude": business["latitude"],
-                "High Traffic Longitude": business["longitude"],
-                "Related Brand": row["Brand"],
-                "Related Brand Latitude": nearest_related_brand["latitude"],
-                "Related Brand Longitude": nearest_related_brand["longitude"],
-                "Related Brand Correlation": row["Count"],
-                "Distance to Related Brand (km)": nearest_related_brand[
-                    "distance"
-                ],
-            }
-            results.append(result)
+    # Find the nearest related brand location
+    nearest = candidates.loc[
+        candidates.groupby("safegraph_place_id", sort=False)[
+            "Distance to Related Brand (km)"
+        ].idxmin()
+    ]
 
-    return pd.DataFrame(results)
+    return nearest.rename(
+        columns={
+            "safegraph_place_id": "Safegraph Place ID",
+            "location_name": "High Traffic Location",
+            "latitude": "High Traffic Latitude",
+            "longitude": "High Traffic Longitude",
+        }
+    )[
+        [
+            "Safegraph Place ID",
+            "High Traffic Location",
+            "High Traffic Latitude",
+            "High Traffic Longitude",
+            "Related Brand",
+            "Related Brand Latitude",
+            "Related Brand Longitude",
+            "Related Brand Correlation",
+            "Distance to Related Brand (km)",
+        ]
+    ].reset_index(
+        drop=True
+    )
 
 
-def compute_fastest_routes(df: pd.DataFrame) -> pd.DataFrame:
+def compute_fastest_routes(
+    df: pd.DataFrame, max_workers: int = 8
+) -> pd.DataFrame:
     """
     Computes the fastest foot routes between high traffic locations
     and related brand locations using Open Source Routing Machine (OSRM).
+    Requests are sent concurrently over a shared, pooled HTTP session.
 
     Args:
         df (pd.DataFrame): DataFrame containing the latitude and longitude
         of high traffic locations and related brand locations,
         along with additional related brand information.
 
+        max_workers (int): The maximum number of concurrent
+        requests to OSRM. Defaults to 8.
+
     Returns:
         pd.DataFrame: A DataFrame containing route information including
         the high traffic location, related brand, correlation, distance,
         duration, and route geometry.
     """
-    routes = []
     osrm_url = "http://router.project-osrm.org/route/v1/foot/"
 
-    for _, row in df.iterrows():
-        if (
-            pd.notna(row["High Traffic Latitude"])
-            and pd.notna(row["High Traffic Longitude"])
-            and pd.notna(row["Related Brand Latitude"])
-            and pd.notna(row["Related Brand Longitude"])
-        ):
-            request_url = (
-                f"{osrm_url}{row['High Traffic Longitude']},"
-                f"{row['High Traffic Latitude']};"
-                f"{row['Related Brand Longitude']},"
-                f"{row['Related Brand Latitude']}?overview=full"
+    # Keep only rows with coordinates for both ends of the route
+    rows = df.dropna(
+        subset=[
+            "High Traffic Latitude",
+            "High Traffic Longitude",
+            "Related Brand Latitude",
+            "Related Brand Longitude",
+        ]
+    ).to_dict("records")
+    request_urls = [
+        f"{osrm_url}{row['High Traffic Longitude']},"
+        f"{row['High Traffic Latitude']};"
+        f"{row['Related Brand Longitude']},"
+        f"{row['Related Brand Latitude']}?overview=full"
+        for row in rows
+    ]
+
+    # Define local function to fetch a single route
+    def fetch_route(request_url):
+        try:
+            response = session.get(request_url)
+            response.raise_for_status()
+            return response.json()
+        except requests.RequestException as e:
+            print(f"Request failed: {e}")
+            return None
+
+    # Send requests concurrently, reusing connections across requests
+    with requests.Session() as session:
+        adapter = HTTPAdapter(
+            pool_connections=max_workers, pool_maxsize=max_workers
+        )
+        session.mount("http://", adapter)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = list(executor.map(fetch_route, request_urls))
+
+    routes = []
+    for row, route_data in zip(rows, responses):
+        if route_data is None:
+            continue
+
+        if "routes" in route_data and route_data["routes"]:
+            first_route = route_data["routes"][0]
+            geometry = first_route.get("geometry")
+            decoded_geometry = polyline.decode(geometry)
+
+            route_info = {
+                "High Traffic Location": row["High Traffic Location"],
+                "Related Brand": row["Related Brand"],
+                "Related Brand Correlation": row["Related Brand Correlation"],
+                "Distance": first_route["distance"],
+                "Duration": first_route["duration"],
+                "Geometry": decoded_geometry,
+            }
+            routes.append(route_info)
+        else:
+            print(
+                f"No route found for {row['High Traffic Location']} "
+                f"to {row['Related Brand']}"
             )
-            try:
-                response = requests.get(request_url)
-                response.raise_for_status()
-
-                route_data = response.json()
-
-                if "routes" in route_data and route_data["routes"]:
-                    first_route = route_data["routes"][0]
-                    geometry = first_route.get("geometry")
-                    decoded_geometry = polyline.decode(geometry)
-
-                    route_info = {
-                        "High Traffic Location": row["High Traffic Location"],
-                        "Related Brand": row["Related Brand"],
-                        "Related Brand Correlation": row[
-                            "Related Brand Correlation"
-                        ],
-                        "Distance": first_route["distance"],
-                        "Duration": first_route["duration"],
-                        "Geometry": decoded_geometry,
-                    }
-                    routes.append(route_info)
-                else:
-                    print(
-                        f"No route found for {row['High Traffic Location']} "
-                        f"to {row['Related Brand']}"
-                    )
-            except requests.RequestException as e:
-                print(f"Request failed: {e}")
 
     return pd.DataFrame(routes)
 
@@ -419,8 +504,13 @@ def plot_routes(
         """
         map_obj.get_root().html.add_child(folium.Element(legend_html))
 
-        # Add the routes to the map
-        for index, row in df_routes.iterrows():
+        # Collect routes and markers into one feature group per layer
+        routes_layer = folium.FeatureGroup(name="Routes")
+        high_traffic_layer = folium.FeatureGroup(name="High Traffic Locations")
+        related_brand_layer = folium.FeatureGroup(name="Related Brands")
+
+        # Add the routes to their layers
+        for row in df_routes.to_dict("records"):
             route_color = next(colors)
             popup_text = (
                 f"Route from {row['High Traffic Location']} to"
@@ -438,20 +528,24 @@ def plot_routes(
                 color=route_color,
                 opacity=opacity,
                 popup=folium.Popup(popup_text, parse_html=True),
-            ).add_to(map_obj)
+            ).add_to(routes_layer)
 
             # Add markers for the start and end points
             folium.Marker(
-                location=[row["Geometry"][0][0], row["Geometry"][0][1]],
+                location=row["Geometry"][0],
                 popup=f"High Traffic Location: {row['High Traffic Location']}",
                 icon=folium.Icon(color="red"),
-            ).add_to(map_obj)
+            ).add_to(high_traffic_layer)
 
             folium.Marker(
-                location=[row["Geometry"][-1][0], row["Geometry"][-1][1]],
+                location=row["Geometry"][-1],
                 popup=f"Related Brand: {row['Related Brand']}",
                 icon=folium.Icon(color="blue"),
-            ).add_to(map_obj)
+            ).add_to(related_brand_layer)
+
+        # Add the layers to the map at once
+        for layer in (routes_layer, high_traffic_layer, related_brand_layer):
+            layer.add_to(map_obj)
 
         if output_file_name:
             map_obj.save(f"data/foot-traffic/output/{output_file_name}")
@@ -533,7 +627,10 @@ def plot_top_restaurants(df: pd.DataFrame) -> None:
 
 
 def split_into_months(
-    df: pd.DataFrame, city: str, persist: bool = False
+    df: pd.DataFrame,
+    city: str,
+    persist: bool = False,
+    file_format: str = "parquet",
 ) -> List[pd.DataFrame]:
     """Takes a Safegraph foot traffic DataFrame and splits it into
     12 DataFrames, one for each month of the year. Optionally
@@ -547,25 +644,52 @@ def split_into_months(
         persist (`bool`): A boolean indicating whether the DataFrame
             should be saved to local file storage.
 
+        file_format (`str`): The format of the saved files, either
+            "parquet" or "csv". Defaults to "parquet".
+
+    Raises:
+        `ValueError` if the file format is not supported.
+
     Returns:
         (`list` of `pd.DataFrame`): The month-based DataFrames.
     """
+    # Validate file format
+    if file_format not in ("parquet", "csv"):
+        raise ValueError(
+            f'Unsupported file format "{file_format}". Expected '
+            '"parquet" or "csv".'
+        )
+
     # Extract month from the date
-    df["month"] = df["date_range_start"].str[5:7].astype("Int64")
+    df["month"] = df["date_range_start"].str[5:7].astype("Int8")
 
     # Create a directory for saving the output
     output_dir = f"{DATA_DIR}/foot-traffic/output"
-    os.makedirs(output_dir, exist_ok=True)
+    if persist:
+        os.makedirs(output_dir, exist_ok=True)
+    output_path_template = os.path.join(
+        output_dir, f"{city}_month_{{month}}.{file_format}"
+    )
+
+    # Partition the DataFrame by month in a single pass
+    month_groups = dict(tuple(df.groupby("month")))
 
     # Create and save a dataframe for each month
     df_lst = []
     for month in range(1, 13):
-        month_df = df[df["month"] == month]
+        month_df = month_groups.get(month, df.iloc[0:0])
         df_lst.append(month_df)
         if persist:
-            output_file_name = f"{city}_month_{month}.csv"
-            output_file_path = os.path.join(output_dir, output_file_name)
-            month_df.to_csv(output_file_path, index=False)
+            output_file_path = output_path_template.format(month=month)
+            if file_format == "parquet":
+                month_df.to_parquet(
+                    output_file_path,
+                    index=False,
+                    engine="pyarrow",
+                    compression="zstd",
+                )
+            else:
+                month_df.to_csv(output_file_path, index=False)
     return df_lst
 
 
@@ -759,11 +883,11 @@ def top_x_businesses_and_related(df, x):
         # Filter for the current business
         business_data = df[df["location_name"] == business].copy()
 
-        # Safely convert the JSON string in related_same_day_brand to a list,
-        # handling None values
+        # Safely convert the JSON string in related_same_day_brand to a
+        # dictionary of brands, handling None values
         business_data["related_same_day_brand_list"] = business_data[
             "related_same_day_brand"
-        ].apply(lambda x: json.loads(x) if x is not None else [])
+        ].map(_parse_related_brands)
 
         # Explode the DataFrame so each brand has its own row
         all_related_brands = business_data.explode(
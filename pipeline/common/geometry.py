@@ -204,7 +204,7 @@ class BoundingBox(BaseModel):
         return slices
 
     def split_into_squares(
-        self, size_in_degrees: Decimal
+        self, size_in_degrees: Union[float, Decimal]
     ) -> List["BoundingBox"]:
         """Splits the bounding box into squares of the given size in degrees.
         If the bounding box cannot be divided into squares, its dimensions
@@ -227,35 +227,30 @@ class BoundingBox(BaseModel):
                 "number for the size of the square subdivisions."
             )
 
-        # Initialize rounding strategy to prevent long decimals
-        context = Context(rounding=ROUND_HALF_UP)
-
         # Coerce bounding box into square shape
-        longest_side = max(self.width, self.height)
-        max_x = self.min_x + longest_side
-        max_y = self.min_y + longest_side
-        bbox = BoundingBox(
-            min_x=self.min_x, max_x=max_x, min_y=self.min_y, max_y=max_y
-        )
+        longest_side = float(max(self.width, self.height))
 
         # Determine number of rows/columns necessary for sub-squares of equal size
-        subcell_length = min(bbox.height, size_in_degrees)
-        dim = math.ceil(bbox.height / subcell_length)
+        subcell_length = min(longest_side, float(size_in_degrees))
+        dim = math.ceil(longest_side / subcell_length)
+
+        # Compute edges of sub-squares along each axis once, rounding
+        # to prevent long decimals
+        min_x = float(self.min_x)
+        min_y = float(self.min_y)
+        x_edges = [round(min_x + i * subcell_length, 6) for i in range(dim + 1)]
+        y_edges = [round(min_y + i * subcell_length, 6) for i in range(dim + 1)]
 
         # Subdivide bounding box into squares
         squares = []
         for i in range(dim):
-            slice_min_x = float(self.min_x + (i * subcell_length))
-            slice_max_x = slice_min_x + float(subcell_length)
             for j in range(dim):
-                slice_min_y = float(self.min_y + (j * subcell_length))
-                slice_max_y = slice_min_y + float(subcell_length)
                 squares.append(
                     BoundingBox(
-                        min_x=round(Decimal(slice_min_x, context), 6),
-                        max_x=round(Decimal(slice_max_x, context), 6),
-                        min_y=round(Decimal(slice_min_y, context), 6),
-                        max_y=round(Decimal(slice_max_y, context), 6),
+                        min_x=x_edges[i],
+                        max_x=x_edges[i + 1],
+                        min_y=y_edges[j],
+                        max_y=y_edges[j + 1],
                     )
                 )
 
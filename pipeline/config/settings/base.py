@@ -18,6 +18,7 @@ class BaseConfig(Configuration):
     PROJECT_DIR = BASE_DIR / "pipeline"
     DATA_DIR = BASE_DIR / "data"
     FIXTURES_DIR = DATA_DIR / "fixtures"
+    CACHE_DIR = DATA_DIR / "cache"
     STATIC_ROOT = os.path.join(PROJECT_DIR, "staticfiles")
     STATIC_URL = "/static/"
 
@@ -16,7 +16,7 @@ from foodware.models import (
     PoiProviderCategory,
 )
 from foodware.places import IPlacesProvider, IPlacesProviderFactory
-from shapely import wkt
+from shapely import wkb
 
 
 class Command(BaseCommand):
@@ -105,7 +105,7 @@ class Command(BaseCommand):
         # Parse project's geographic boundary into Shapely object
         try:
             self._logger.info("Parsing model geography boundary.")
-            polygon = wkt.loads(project.locale.geometry.wkt)
+            polygon = wkb.loads(bytes(project.locale.geometry.wkb))
         except AttributeError as e:
             self._logger.error(
                 f'Unable to convert model boundary to Shapely object. "{e}".'
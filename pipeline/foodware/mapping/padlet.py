@@ -11,6 +11,7 @@ from urllib.parse import urlparse
 # Third-party imports
 import requests
 from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
@@ -76,6 +77,10 @@ class PadletClient:
                 f'Missing expected environment variable "{e}".'
             ) from None
 
+        # Resolve local ChromeDriver executable, if configured; otherwise,
+        # Selenium Manager looks up a matching driver when a browser launches
+        self._chromedriver_path = os.environ.get("CHROMEDRIVER_PATH")
+
         # Set remaining fields
         self._browser = None
         self._logger = logger
@@ -96,9 +101,15 @@ class PadletClient:
         )
         self._launch_homepage()
 
-        # Log into site using user name and password
+        # Log into site using user name and password, discarding
+        # the browser on failure so that it is not reused later
         self._logger.info("Logging in with user name and password.")
-        self._authenticate()
+        try:
+            self._authenticate()
+        except RuntimeError:
+            self._browser.quit()
+            self._browser = None
+            raise
 
         # Log results
         self._logger.info("Browser successfully initialized.")
@@ -123,19 +134,22 @@ class PadletClient:
             chromeOptions.add_argument("--headless")
             chromeOptions.add_argument("--disable-dev-shm-usage")
             chromeOptions.add_argument("--hide-scrollbars")
-            browser = webdriver.Chrome(options=chromeOptions)
+            service = Service(executable_path=self._chromedriver_path)
+            browser = webdriver.Chrome(service=service, options=chromeOptions)
 
             # Navigate to page and wait to load
             browser.get(self._homepage_url)
             time.sleep(self.DEFAULT_SECONDS_WAIT_PAGE_LOAD)
 
-            # Confirm page has loaded correctly or raise error if attempts exhausted
+            # Confirm page has loaded correctly
             if self.BROWSER_TITLE_CHECK_STRING in browser.title:
                 break
-            elif num_attempts >= self.MAX_ATTEMPTS_PAGE_RELOAD:
-                raise RuntimeError("Page failed to load correctly.")
-            else:
-                num_attempts += 1
+
+            # Otherwise, shut down the browser process before retrying
+            browser.quit()
+            num_attempts += 1
+        else:
+            raise RuntimeError("Page failed to load correctly.")
 
         self._browser = browser
 
@@ -374,8 +388,13 @@ class PadletClient:
             (`dict`): A representation of the newly-created board,
                 with all post and section data.
         """
-        # Initialize web browser instance
-        self._initialize_browser()
+        # Initialize web browser instance, reusing the
+        # authenticated browser from a previous board if one exists
+        if self._browser is None:
+            self._initialize_browser()
+        else:
+            self._browser.get(self._homepage_url)
+            time.sleep(self.DEFAULT_SECONDS_WAIT_PAGE_LOAD)
 
         # Create new board from template
         self._logger.info(
@@ -1,10 +1,8 @@
 # Generated by Django 5.0.3 on 2024-03-12 01:15
 
-# Standard library imports
-import json
-
 # Third-party imports
 import geopandas as gpd
+import orjson
 
 # Application imports
 from common.storage import IDataStoreFactory
@@ -19,7 +17,7 @@ def _load_poi_providers(apps, storage):
     # Read POI providers from file
     try:
         with storage.open_file(settings.POI_PROVIDERS_FPATH) as f:
-            poi_providers = json.load(f)
+            poi_providers = orjson.loads(f.read())
     except FileNotFoundError:
         raise RuntimeError(
             "Data load failed. Could not resolve the file path "
@@ -30,12 +28,10 @@ def _load_poi_providers(apps, storage):
     # Fetch Django model from app registry
     django_model = apps.get_model("foodware", "PoiProvider")
 
-    # Load providers into database table represented by model
-    created = []
-    for provider in poi_providers:
-        created.append(django_model.objects.create(name=provider))
-
-    return created
+    # Load providers into database table represented by model in one batch
+    return django_model.objects.bulk_create(
+        django_model(name=provider) for provider in poi_providers
+    )
 
 
 def _load_poi_parent_categories(apps, storage):
@@ -43,7 +39,7 @@ def _load_poi_parent_categories(apps, storage):
     # Read POI parent categories from file
     try:
         with storage.open_file(settings.POI_PARENT_CATEGORIES) as f:
-            poi_categories = json.load(f)
+            poi_categories = orjson.loads(f.read())
     except FileNotFoundError:
         raise RuntimeError(
             "Data load failed. Could not resolve the file path "
@@ -54,12 +50,10 @@ def _load_poi_parent_categories(apps, storage):
     # Fetch Django model from app registry
     django_model = apps.get_model("foodware", "PoiParentCategory")
 
-    # Load categories into database table represented by model
-    created = []
-    for category in poi_categories:
-        created.append(django_model.objects.create(name=category))
-
-    return created
+    # Load categories into database table represented by model in one batch
+    return django_model.objects.bulk_create(
+        django_model(name=category) for category in poi_categories
+    )
 
 
 def _load_poi_provider_categories(apps, storage, parent_cats, providers):
@@ -67,7 +61,7 @@ def _load_poi_provider_categories(apps, storage, parent_cats, providers):
     # Read POI provider categories from file
     try:
         with storage.open_file(settings.POI_PROVIDER_CATEGORIES) as f:
-            poi_categories = json.load(f)
+            poi_categories = orjson.loads(f.read())
     except FileNotFoundError:
         raise RuntimeError(
             "Data load failed. Could not resolve the file path "
@@ -78,21 +72,18 @@ def _load_poi_provider_categories(apps, storage, parent_cats, providers):
     # Fetch Django model from app registry
     django_model = apps.get_model("foodware", "PoiProviderCategory")
 
-    # Load categories into database table represented by model
-    created = []
+    # Load categories into database table represented by model in one batch
     parent_lookup = {c.name: c.id for c in parent_cats}
     provider_lookup = {p.name: p.id for p in providers}
-    for category in poi_categories:
-        created.append(
-            django_model.objects.create(
-                parent_id=parent_lookup[category["parent"]],
-                provider_id=provider_lookup[category["provider"]],
-                name=category["name"],
-                active=category["active"],
-            )
+    return django_model.objects.bulk_create(
+        django_model(
+            parent_id=parent_lookup[category["parent"]],
+            provider_id=provider_lookup[category["provider"]],
+            name=category["name"],
+            active=category["active"],
         )
-
-    return created
+        for category in poi_categories
+    )
 
 
 def _load_locales(apps, storage):
@@ -124,14 +115,12 @@ def _load_locales(apps, storage):
     # Fetch Django model from app registry
     django_model = apps.get_model("foodware", "Locale")
 
-    # Load locales into database table represented by model
-    created = []
-    for _, row in locales_gdf.iterrows():
-        created.append(
-            django_model.objects.create(
-                name=row["name"], geometry=GEOSGeometry(row["geometry"].wkt)
-            )
-        )
+    # Load locales into database table represented by model in one batch,
+    # passing geometries as WKB, which is cheaper to parse than WKT
+    django_model.objects.bulk_create(
+        django_model(name=name, geometry=GEOSGeometry(memoryview(geom.wkb)))
+        for name, geom in zip(locales_gdf["name"], locales_gdf["geometry"])
+    )
 
 
 def callback(apps, schema_editor):
@@ -3,16 +3,18 @@
 
 # Standard library imports
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Dict, List, Optional, Union
 
 # Third-party imports
-from shapely import MultiPolygon, Point, Polygon
+from shapely import MultiPolygon, Polygon, contains_xy
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Place:
-    """Represents a generic place."""
+    """Represents a generic place. Declared with slots to reduce the
+    memory held per instance when mapping large numbers of places.
+    """
 
     id: str
     """The unique identifier for the place within its external data source.
@@ -152,24 +154,28 @@ class IPlacesProvider(ABC):
         Returns:
             (`list` of `dict`): The cleaned places.
         """
+        # Map places and filter out closed locations
+        mapped = [self.map_place(place) for place in places]
+        mapped = [place for place in mapped if not place.is_closed]
+
+        # Test whether places lie within bounds in a single vectorized call
+        within_bounds = contains_xy(
+            geo,
+            [place.lon for place in mapped],
+            [place.lat for place in mapped],
+        )
+
+        # Filter out dupes and places outside bounds
         visited_ids = set()
         cleaned = []
-        for place in places:
-            # Map place
-            mapped = self.map_place(place)
-
-            # Filter out dupes and places outside bounds
-            if (
-                (mapped.id in visited_ids)
-                or (mapped.is_closed)
-                or (not geo.contains(Point(mapped.lon, mapped.lat)))
-            ):
+        for place, is_within in zip(mapped, within_bounds):
+            if (place.id in visited_ids) or (not is_within):
                 continue
 
             # If valid place, map to standard format and append to list
-            cleaned.append(vars(mapped))
+            cleaned.append(asdict(place))
 
             # Mark place as seen
-            visited_ids.add(mapped.id)
+            visited_ids.add(place.id)
 
         return cleaned
@@ -5,7 +5,6 @@
 import logging
 import os
 import time
-from decimal import Decimal
 from enum import Enum
 from typing import Dict, List, Tuple, Union
 
@@ -293,7 +292,7 @@ class GooglePlacesClient(IPlacesProvider):
         # Divide box into grid of cells of approximately equal length and width
         # NOTE: Small size differences may exist due to rounding.
         cells: List[BoundingBox] = bbox.split_into_squares(
-            size_in_degrees=Decimal(str(max_side_degrees))
+            size_in_degrees=max_side_degrees
         )
 
         # Determine initial search radius for cells
@@ -215,9 +215,7 @@ class TomTomSearchClient(IPlacesProvider):
                 return pois, errors
 
             # Otherwise, extract business data from response body JSON
-            page_pois = data.get("results", [])
-            for poi in page_pois:
-                pois.append(poi)
+            pois.extend(data.get("results", []))
 
             # Determine total number of pages of data for query
             num_pages = (data["summary"]["totalResults"] // limit) + (
@@ -5,12 +5,21 @@
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import timedelta
 from typing import Dict, List, Optional, Tuple, Union
 
 # Third-party imports
 import haversine as hs
+import orjson
 import requests
-from bs4 import BeautifulSoup as soup
+import requests_cache
+import shapely
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+from urllib3.util import Retry
 
 # Application imports
 from common.geometry import BoundingBox
@@ -26,6 +35,65 @@ class TripadvisorClient(IPlacesProvider):
     """The maximum number of records that can be returned from a single request.
     """
 
+    MAX_NUM_CONCURRENT_REQUESTS: int = 5
+    """The maximum number of API requests to have in flight at once.
+    """
+
+    MAX_NUM_RETRIES: int = 3
+    """The maximum number of times to retry a request that failed due to a
+    connection error or a transient server error (i.e., a 5XX status code).
+    """
+
+    RETRY_BACKOFF_FACTOR: float = 0.3
+    """The backoff factor applied between retry attempts, in seconds.
+    """
+
+    MIN_SEARCH_RADIUS: float = 0.05
+    """The smallest search radius, in miles, at which a cell may still be
+    divided into quadrants. Cells searched at or below this radius keep
+    their results even if the maximum number of records was returned,
+    which bounds the depth of the quadtree, and are reported as errors.
+    """
+
+    BROWSER_USER_AGENT: str = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+    )
+    """The user agent to send when requesting Tripadvisor webpages directly.
+    """
+
+    CACHE_EXPIRATION: timedelta = timedelta(days=7)
+    """The length of time that cached API responses remain valid.
+    """
+
+    DIRECT_REQUEST_TIMEOUT: float = 15
+    """The number of seconds to wait for a direct webpage request to respond.
+    """
+
+    PROXYSCRAPE_URL: str = (
+        "https://api.proxyscrape.com/v3/accounts/freebies/scraperapi/request"
+    )
+    """The URL of the Proxyscrape API used to render webpages in a browser.
+    """
+
+    RESULTS_CARD_SELECTOR: str = 'div[data-automation="{entity}-card-title"]'
+    """The CSS selector template for the title of each result card on a
+    search results page, formatted with the entity type (e.g., "hotel").
+    """
+
+    RESULTS_PAGE_SIZE: int = 30
+    """The number of results displayed on each search results page.
+    """
+
+    RESULTS_PAGINATION_SELECTOR: str = "div.Ci"
+    """The CSS selector for the pagination summary (e.g., "Showing
+    results 1-30 of 250") on a search results page.
+    """
+
+    ROOM_COUNT_LABEL: str = "NUMBER OF ROOMS"
+    """The text of the element preceding a hotel's room count on its webpage.
+    """
+
     ROOT_URL: str = "https://www.tripadvisor.com"
     """The root URL of the Tripadvisor website.
     """
@@ -58,6 +126,8 @@ class TripadvisorClient(IPlacesProvider):
 
     def __init__(self, logger: logging.Logger) -> None:
         """Initializes a new instance of a `TripadvisorClient`.
+        Successful API responses are cached on disk unless the optional
+        environment variable `TRIPADVISOR_DISABLE_CACHE` is set to "True".
 
         Args:
             logger (`logging.Logger`): An instance of a Python
@@ -81,6 +151,37 @@ class TripadvisorClient(IPlacesProvider):
                 f'Missing expected environment variable "{e}".'
             ) from None
 
+        # Initialize HTTP session to reuse pooled connections across requests
+        retries = Retry(
+            total=TripadvisorClient.MAX_NUM_RETRIES,
+            backoff_factor=TripadvisorClient.RETRY_BACKOFF_FACTOR,
+            status_forcelist=[500, 502, 503, 504],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=32, max_retries=retries
+        )
+        # Cache successful GET responses on disk to avoid spending API quota
+        # on repeated searches across runs, unless caching has been disabled.
+        # Webpages are never cached, as they are large and may be bot
+        # challenges returned with a successful status code.
+        self._session = requests_cache.CachedSession(
+            cache_name=str(settings.CACHE_DIR / "tripadvisor"),
+            backend="sqlite",
+            expire_after=TripadvisorClient.CACHE_EXPIRATION,
+            urls_expire_after={
+                "www.tripadvisor.com": requests_cache.DO_NOT_CACHE
+            },
+            allowable_codes=[200],
+            ignored_parameters=["key"],
+            disabled=(
+                os.environ.get("TRIPADVISOR_DISABLE_CACHE", "False").lower()
+                == "true"
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.headers.update({"accept": "application/json"})
+
     def clean_places(
         self, places: List[Dict], geo: Union[MultiPolygon, Polygon]
     ) -> List[Dict]:
@@ -96,38 +197,31 @@ class TripadvisorClient(IPlacesProvider):
         Returns:
             (`list` of `dict`): The cleaned places.
         """
-        # Initialize variables
-        visited_ids = set()
-        cleaned_places = []
-
-        # Process each raw place
-        for place in places:
-            # Extract id
-            id = place["location_id"]
-
-            # Skip processing if already visited
-            if id in visited_ids:
-                continue
-
-            # Otherwise, fetch and parse place details
-            details = self.get_location_details(id)
-            lon = float(details["longitude"])
-            lat = float(details["latitude"])
-
-            # Terminate processing if place outside geography
-            if geo and not geo.contains(Point(lon, lat)):
-                visited_ids.add(id)
-                continue
-
-            # Otherwise, fetch place room count
-            details["room_count"] = self.get_room_count(details["web_url"])
-
-            # Map place to standard format and append to list
-            mapped = self.map_place(details)
-            cleaned_places.append(vars(mapped))
+        # Collect unique location ids, preserving order
+        ids = list(dict.fromkeys(place["location_id"] for place in places))
+
+        # Fetch place details and room counts concurrently
+        with ThreadPoolExecutor(
+            max_workers=TripadvisorClient.MAX_NUM_CONCURRENT_REQUESTS
+        ) as executor:
+            # Fetch details and keep only places within geography
+            all_details = []
+            for details in executor.map(self.get_location_details, ids):
+                lon = float(details["longitude"])
+                lat = float(details["latitude"])
+                if not geo or geo.contains(Point(lon, lat)):
+                    all_details.append(details)
+
+            # Scrape room counts from place webpages
+            room_counts = executor.map(
+                self.get_room_count, (d["web_url"] for d in all_details)
+            )
 
-            # Mark place as seen
-            visited_ids.add(id)
+            # Map places to standard format
+            cleaned_places = []
+            for details, room_count in zip(all_details, room_counts):
+                details["room_count"] = room_count
+                cleaned_places.append(asdict(self.map_place(details)))
 
         return cleaned_places
 
@@ -143,33 +237,14 @@ class TripadvisorClient(IPlacesProvider):
         # Add delay before request
         time.sleep(TripadvisorClient.SECONDS_DELAY_PER_REQUEST)
 
-        # Define local function to send location details request to Tripadvisor API
-        def send_request():
-            url = TripadvisorClient.LOCATION_DETAILS_URL.format(location_id=id)
-            headers = {"accept": "application/json"}
-            api_params = {
-                "key": self._tripadvisor_api_key,
-                "language": "en",
-                "currency": "USD",
-            }
-            return requests.get(url, headers=headers, params=api_params)
-
-        # Define local function to handle retries for transient connectivity issues
-        def retry(func, max_retries: int = 3):
-            retries = 0
-            last_error = ValueError("Max retries must be >= 0.")
-            while retries <= max_retries:
-                try:
-                    return func()
-                except Exception as e:
-                    self._logger.error(f"Request failed. {e}")
-                    retries += 1
-                    last_error = e
-                    time.sleep(3)
-            raise last_error
-
-        # Send request
-        r = retry(send_request)
+        # Send location details request to Tripadvisor API
+        url = TripadvisorClient.LOCATION_DETAILS_URL.format(location_id=id)
+        api_params = {
+            "key": self._tripadvisor_api_key,
+            "language": "en",
+            "currency": "USD",
+        }
+        r = self._session.get(url, params=api_params)
 
         # Check for authentication error, in which case
         # processing should end immediately
@@ -193,12 +268,14 @@ class TripadvisorClient(IPlacesProvider):
                 "its daily limit of requests. Please try again later."
             )
 
-        return r.json()
+        return orjson.loads(r.content)
 
     def get_room_count(self, tripadvisor_url: str) -> Optional[int]:
         """Scrapes a Tripadvisor location review webpage for the number of rooms.
         Valid for locations categorized as hotels only, and not all pages are
-        expected to contain this information.
+        expected to contain this information. The page is first requested
+        directly, and only rendered through Proxyscrape if the direct response
+        fails or does not contain the room count (e.g., a bot challenge page).
 
         Args:
             tripadvisor_url (`str`): The URL to the webpage.
@@ -206,9 +283,56 @@ class TripadvisorClient(IPlacesProvider):
         Returns:
             (`int` | `None`): The room count, if one exists.
         """
+        # Attempt to fetch webpage directly, requesting HTML in place of
+        # the JSON accepted by default for API calls
+        html = None
+        try:
+            r = self._session.get(
+                tripadvisor_url,
+                headers={
+                    "Accept": "text/html,application/xhtml+xml",
+                    "User-Agent": TripadvisorClient.BROWSER_USER_AGENT,
+                },
+                timeout=TripadvisorClient.DIRECT_REQUEST_TIMEOUT,
+            )
+            if r.ok and TripadvisorClient.ROOM_COUNT_LABEL in r.text:
+                html = r.text
+        except requests.exceptions.RequestException as e:
+            self._logger.warning(
+                f'Failed to fetch "{tripadvisor_url}" directly. {e}'
+            )
+
+        # Otherwise, fall back to rendering webpage in a browser
+        if html is None:
+            html = self._fetch_browser_html(tripadvisor_url)
+
+        # Parse room count from the first div following its label
+        divs = iter(LexborHTMLParser(html).css("div"))
+        for div in divs:
+            if div.text(deep=False, strip=True) == (
+                TripadvisorClient.ROOM_COUNT_LABEL
+            ):
+                room_count_div = next(divs, None)
+                break
+        else:
+            return None
+        try:
+            return int(room_count_div.text(strip=True))
+        except (AttributeError, ValueError):
+            return None
+
+    def _fetch_browser_html(self, url: str) -> str:
+        """Fetches the HTML of a webpage as rendered by a
+        headless browser through the Proxyscrape API.
+
+        Args:
+            url (`str`): The URL to the webpage.
+
+        Returns:
+            (`str`): The rendered HTML.
+        """
         # Initialize request parameters
-        url = "https://api.proxyscrape.com/v3/accounts/freebies/scraperapi/request"
-        data = {"url": tripadvisor_url, "browserHtml": True}
+        data = {"url": url, "browserHtml": True}
         headers = {
             "Content-Type": "application/json",
             "X-Api-Key": self._proxyscrape_api_key,
@@ -216,7 +340,9 @@ class TripadvisorClient(IPlacesProvider):
 
         # Send request
         time.sleep(TripadvisorClient.SECONDS_DELAY_PER_REQUEST)
-        r = requests.post(url, headers=headers, json=data)
+        r = self._session.post(
+            TripadvisorClient.PROXYSCRAPE_URL, headers=headers, json=data
+        )
 
         # Handle error
         if not r.ok:
@@ -226,16 +352,7 @@ class TripadvisorClient(IPlacesProvider):
                 f'the message "{r.text}".'
             )
 
-        # Otherwise, parse response
-        html = r.json()["data"]["browserHtml"]
-        s = soup(html, features="lxml")
-        try:
-            room_count_div = s.find("div", text="NUMBER OF ROOMS").find_next(
-                "div"
-            )
-            return int(room_count_div.text.strip())
-        except (AttributeError, ValueError):
-            return None
+        return orjson.loads(r.content)["data"]["browserHtml"]
 
     def map_place(self, place: Dict) -> Place:
         """Maps a place fetched from a data source to a standard representation.
@@ -280,15 +397,130 @@ class TripadvisorClient(IPlacesProvider):
         """Locates all POIs within the given area and categories.
         The area is further divided into a grid of quadrants if
         more results are available within the area than can be
-        returned due to API limits.
+        returned due to API limits. Quadrants are searched one
+        level at a time, with the requests for each level sent
+        concurrently.
+
+        Args:
+            original_geo (`Polygon` or `MultiPolygon`): The boundary
+                used to skip quadrants that lie outside of the geography.
+
+            box (`BoundingBox`): The bounding box.
+
+            category (`str`): The category to search by.
+
+            search_radius (`float`): The search radius, in miles.
+
+        Returns:
+            ((`list` of `dict`, `list` of `dict`,)): A two-item tuple
+                consisting of the list of retrieved places and a list
+                of any errors that occurred, respectively.
+        """
+
+        # Define local function to search within a single cell
+        def search_cell(cell: Tuple[BoundingBox, float]):
+            return self.search_nearby(*cell, category)
+
+        # Prepare geography to speed up repeated intersection tests
+        shapely.prepare(original_geo)
+
+        # Search cells level by level, splitting any cell whose
+        # number of POIs returned equals the max into quadrants.
+        # Search circles of neighboring cells overlap, so POIs
+        # already collected are skipped using their location ids.
+        pois, errors = [], []
+        seen_ids = set()
+        cells = [(box, search_radius)]
+        with ThreadPoolExecutor(
+            max_workers=TripadvisorClient.MAX_NUM_CONCURRENT_REQUESTS
+        ) as executor:
+            while cells:
+                sub_cells = []
+                results = executor.map(search_cell, cells)
+                for (cell, radius), (cell_pois, cell_errs) in zip(
+                    cells, results
+                ):
+                    errors.extend(cell_errs)
+                    is_full = (
+                        len(cell_pois)
+                        >= TripadvisorClient.MAX_NUM_RESULTS_PER_REQUEST
+                    )
+                    if is_full and radius > TripadvisorClient.MIN_SEARCH_RADIUS:
+                        fanout = self.estimate_fanout(cell_pois, radius)
+                        for sub in cell.split_along_axes(fanout, fanout):
+                            if sub.intersects_with(original_geo):
+                                sub_cells.append((sub, radius / fanout))
+                    else:
+                        # Flag cells that still return the max number of
+                        # POIs at the minimum radius, as some may be missed
+                        if is_full:
+                            msg = (
+                                "Search results may be incomplete. The "
+                                "maximum number of POIs was returned for "
+                                f"the cell centered at ({cell.center.lat}, "
+                                f"{cell.center.lon}) with radius {radius} "
+                                f"{TripadvisorClient.NEARBY_SEARCH_RADIUS_UNIT}"
+                                ", which cannot be divided further."
+                            )
+                            self._logger.warning(msg)
+                            errors.append({"error": msg})
+                        for poi in cell_pois:
+                            if poi["location_id"] not in seen_ids:
+                                seen_ids.add(poi["location_id"])
+                                pois.append(poi)
+                cells = sub_cells
+
+        return pois, errors
+
+    def estimate_fanout(self, places: List[Dict], search_radius: float) -> int:
+        """Estimates how many times a full cell should be divided along
+        each axis. Results are returned nearest first, so if the API's
+        maximum number of places all lie well within the search radius,
+        the area likely holds many more places than can be returned, and
+        the cell is split more finely to skip intermediate levels of the
+        quadtree. The number of places in the full circle is approximated
+        as the number returned scaled by the ratio of the circle's area to
+        the area of the circle through the farthest place returned.
+
+        Args:
+            places (`list` of `dict`): The places returned for the cell.
+
+            search_radius (`float`): The search radius, in miles.
+
+        Returns:
+            (`int`): The number of divisions per axis (2, 4, or 8).
+        """
+        # Determine distance to farthest place returned, in miles
+        try:
+            max_distance = max(float(p["distance"]) for p in places)
+        except (KeyError, TypeError, ValueError):
+            return 2
+
+        # Estimate ratio of places available to places returned
+        if max_distance <= 0:
+            return 8
+        ratio = (search_radius / max_distance) ** 2
+
+        # Map ratio to number of divisions
+        if ratio < 4:
+            return 2
+        elif ratio < 16:
+            return 4
+        else:
+            return 8
+
+    def search_nearby(
+        self, box: BoundingBox, search_radius: float, category: str
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """Issues a single nearby search request for POIs within the
+        circle of the given radius around the bounding box's center.
 
         Args:
             box (`BoundingBox`): The bounding box.
 
-            categories (`list` of `str`): The categories to search by.
+            search_radius (`float`): The search radius, in miles.
 
-            search_radius (`float`): The search radius, converted from
-                meters to the larger of degrees longitude and latitude.
+            category (`str`): The category to search by.
 
         Returns:
             ((`list` of `dict`, `list` of `dict`,)): A two-item tuple
@@ -305,28 +537,10 @@ class TripadvisorClient(IPlacesProvider):
             "language": "en",
         }
 
-        # Define local function to send nearby search request to Tripadvisor API
-        def send_request():
-            url = TripadvisorClient.NEARBY_SEARCH_URL
-            headers = {"accept": "application/json"}
-            return requests.get(url, headers=headers, params=api_params)
-
-        # Define local function to handle retries for transient connectivity issues
-        def retry(func, max_retries: int = 3):
-            retries = 0
-            last_error = ValueError("Max retries must be >= 0.")
-            while retries <= max_retries:
-                try:
-                    return func()
-                except Exception as e:
-                    self._logger.error(f"Request failed. {e}")
-                    retries += 1
-                    last_error = e
-                    time.sleep(3)
-            raise last_error
-
-        # Send request
-        r = retry(send_request)
+        # Send nearby search request to Tripadvisor API
+        r = self._session.get(
+            TripadvisorClient.NEARBY_SEARCH_URL, params=api_params
+        )
 
         # Check for authentication error, in which case
         # processing should end immediately
@@ -353,7 +567,7 @@ class TripadvisorClient(IPlacesProvider):
         # Otherwise, sleep and then parse JSON from response body
         try:
             time.sleep(TripadvisorClient.SECONDS_DELAY_PER_REQUEST)
-            payload = r.json()
+            payload = orjson.loads(r.content)
         except Exception as e:
             self._logger.error(f"Failed to parse reponse body JSON. {e}")
             return [], [{"api_params": api_params, "error": str(e)}]
@@ -372,23 +586,6 @@ class TripadvisorClient(IPlacesProvider):
             self._logger.warning("No data found in response body.")
             return [], []
 
-        # Otherwise, if number of POIs returned equals max,
-        # split box and recursively issue HTTP requests
-        if (
-            len(payload["data"])
-            >= TripadvisorClient.MAX_NUM_RESULTS_PER_REQUEST
-        ):
-            pois, errors = [], []
-            sub_cells = box.split_along_axes(x_into=2, y_into=2)
-            for sub in sub_cells:
-                if sub.intersects_with(original_geo):
-                    sub_hotels, sub_errs = self.find_places_in_bounding_box(
-                        original_geo, sub, category, search_radius / 2
-                    )
-                    pois.extend(sub_hotels)
-                    errors.extend(sub_errs)
-            return pois, errors
-
         # Otherwise, return locations
         return payload["data"], []
 
@@ -440,7 +637,7 @@ class TripadvisorClient(IPlacesProvider):
         diagonal_length = hs.haversine(
             top_left_pt, bottom_right_pt, hs.Unit.MILES
         )
-        search_radius = round(diagonal_length / 2)
+        search_radius = diagonal_length / 2
 
         # Locate all POIs within bounding box for each specified category
         pois = []
@@ -492,14 +689,13 @@ class TripadvisorClient(IPlacesProvider):
 
         # Search Tripadvisor for locations affiliated with query
         url = TripadvisorClient.TEXT_SEARCH_URL
-        headers = {"accept": "application/json"}
         api_params = {
             "key": self._tripadvisor_api_key,
             "searchQuery": clean_query,
             "category": "geos",
             "language": "en",
         }
-        r = requests.get(url, headers=headers, params=api_params)
+        r = self._session.get(url, params=api_params)
 
         # Check for authentication error, in which case
         # processing should end immediately
@@ -524,7 +720,7 @@ class TripadvisorClient(IPlacesProvider):
             )
 
         # Otherwise, parse data
-        payload = r.json()
+        payload = orjson.loads(r.content)
 
         # If request failed, return error
         if not r.ok or "error" in payload:
@@ -600,73 +796,61 @@ class TripadvisorClient(IPlacesProvider):
         Returns:
             (`list` of `int`): The location ids.
         """
-        # Initialize variables
-        location_ids = []
-        current_search_results_url = starting_url
-
         # Validate category
         if category == "hotels":
-            entity = "hotel"
+            card_selector = TripadvisorClient.RESULTS_CARD_SELECTOR.format(
+                entity="hotel"
+            )
         else:
             raise ValueError(
                 "Only the hotels category is currently configured to be"
                 " scraped."
             )
 
-        while True:
-            # Initialize request parameters
-            url = "https://api.proxyscrape.com/v3/accounts/freebies/scraperapi/request"
-            data = {"url": current_search_results_url, "browserHtml": True}
-            headers = {
-                "Content-Type": "application/json",
-                "X-Api-Key": self._proxyscrape_api_key,
-            }
-
-            # Send request
-            time.sleep(TripadvisorClient.SECONDS_DELAY_PER_REQUEST)
-            r = requests.post(url, headers=headers, json=data)
-
-            # Handle error if non-success response received
-            if not r.ok:
-                raise RuntimeError(
-                    f'The request to fetch the search results page "{url}" '
-                    f'failed with a "{r.status_code}-{r.reason}" status '
-                    f'code and the message "{r.text}".'
-                )
+        # Parse starting URL (e.g., ".../Hotels-g35805-oa30-Chicago_Illinois-
+        # Hotels.html") into its geography prefix, results offset, and suffix
+        parts = starting_url.split("-")
+        prefix = "-".join(parts[:2])
+        if re.fullmatch(r"oa\d+", parts[2]):
+            offset = int(parts[2][2:])
+            suffix = "-".join(parts[3:])
+        else:
+            offset = 0
+            suffix = "-".join(parts[2:])
 
-            # Otherwise, parse response body
-            html = r.json()["data"]["browserHtml"]
-            s = soup(html, features="lxml")
+        # Initialize variables
+        location_ids = []
+        current_search_results_url = starting_url
 
-            # Get links to all hotels
-            hotel_cards = s.find_all(
-                "div", {"data-automation": f"{entity}-card-title"}
-            )
+        while True:
+            # Fetch rendered search results page
+            html = self._fetch_browser_html(current_search_results_url)
+            tree = LexborHTMLParser(html)
+
+            # Get links to all hotels; stop crawling if page has none
+            hotel_cards = tree.css(card_selector)
+            if not hotel_cards:
+                self._logger.warning(
+                    "No results found on page "
+                    f'"{current_search_results_url}". Ending scrape.'
+                )
+                return location_ids
             for card in hotel_cards:
-                hotel_url = card.find("a")["href"]
+                hotel_url = card.css_first("a").attributes["href"]
                 location_id = hotel_url.split("-")[2].strip("d")
                 location_ids.append(int(location_id))
 
-            # Stop crawling if last results page scraped
-            pagination_text = s.find("div", class_="Ci").text
-            numbers = list(map(int, re.findall(r"\d+", pagination_text)))
-            interval_end_boundary = numbers[-2]
-            total_city_results = numbers[-1]
-            if interval_end_boundary >= total_city_results:
+            # Stop crawling if last results page scraped or
+            # pagination cannot be read from the page
+            pagination_div = tree.css_first(
+                TripadvisorClient.RESULTS_PAGINATION_SELECTOR
+            )
+            if not pagination_div:
+                return location_ids
+            numbers = list(map(int, re.findall(r"\d+", pagination_div.text())))
+            if len(numbers) < 2 or numbers[-2] >= numbers[-1]:
                 return location_ids
 
             # Otherwise, build URL to next results page
-            g_location_id = current_search_results_url.split("-")[1]
-            if "_" in current_search_results_url.split("-")[2]:
-                current_search_results_url = current_search_results_url.replace(
-                    g_location_id, g_location_id + "-oa30"
-                )
-            else:
-                oa_old = current_search_results_url.split("-")[2]
-                oa_old_num = int(oa_old[2:])
-                glocationid_oa = g_location_id + "-" + oa_old
-                oa_new_num = oa_old_num + 30
-                oa_new = "oa" + str(oa_new_num)
-                current_search_results_url = current_search_results_url.replace(
-                    glocationid_oa, g_location_id + "-" + oa_new
-                )
+            offset += TripadvisorClient.RESULTS_PAGE_SIZE
+            current_search_results_url = f"{prefix}-oa{offset}-{suffix}"
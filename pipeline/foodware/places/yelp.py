@@ -5,18 +5,23 @@
 import logging
 import math
 import os
+import threading
 import time
-from decimal import Decimal
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 # Third-party imports
+import orjson
 import requests
 from common.geometry import BoundingBox, convert_meters_to_degrees
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 # Application imports
 from foodware.places.common import IPlacesProvider, Place, PlacesSearchResult
-from shapely import MultiPolygon, Polygon
+from shapely import MultiPolygon, Polygon, STRtree
 
 
 class YelpPOICategories(Enum):
@@ -60,6 +65,11 @@ class YelpPOICategories(Enum):
 class YelpClient(IPlacesProvider):
     """A simple wrapper for the Yelp Fusion API."""
 
+    CATEGORIES_PARAM: str = ",".join(e.value for e in YelpPOICategories)
+    """The comma-delimited list of all relevant POI categories,
+    used as the "categories" query parameter in search requests.
+    """
+
     MAX_NUM_PAGE_RESULTS: int = 50
     """The maximum number of results that can be returned on a single page of
     search results. The inclusive upper bound of the "limit" query parameter.
@@ -69,18 +79,66 @@ class YelpClient(IPlacesProvider):
     """The maximum number of results that can be returned from a single query.
     """
 
+    MAX_NUM_CONCURRENT_CELLS: int = 8
+    """The maximum number of grid cells to search at once.
+    """
+
+    MAX_NUM_CONCURRENT_REQUESTS: int = 5
+    """The maximum number of API requests to have in flight at once.
+    """
+
+    MAX_NUM_CACHED_PAGES: int = 256
+    """The maximum number of fetched pages of search results to hold in
+    memory, after which the least recently used page is evicted.
+    """
+
     MAX_SEARCH_RADIUS_IN_METERS: int = 40_000
     """The maximum size of the suggested search radius in meters.
     Approximately equal to 25 miles.
     """
 
-    def __init__(self, logger: logging.Logger) -> None:
+    MAX_NUM_RETRIES: int = 5
+    """The maximum number of times to retry a request that failed due to a
+    connection error, rate limiting, or a transient server error.
+    """
+
+    RETRY_BACKOFF_FACTOR: float = 0.5
+    """The backoff factor applied between retry attempts, in seconds.
+    """
+
+    RETRY_BACKOFF_JITTER: float = 0.5
+    """The maximum number of seconds of random jitter added to each backoff
+    delay, so that concurrent requests failing together do not retry in
+    lockstep.
+    """
+
+    RETRY_BACKOFF_MAX: float = 10
+    """The maximum number of seconds to wait between retry attempts.
+    """
+
+    LOW_QUOTA_THRESHOLD: int = 100
+    """The number of API calls remaining in the daily quota, as reported by
+    the "RateLimit-Remaining" response header, at or below which requests
+    are paced to avoid exhausting the quota.
+    """
+
+    SECONDS_DELAY_LOW_QUOTA: float = 0.5
+    """The number of seconds to wait after each request once the daily
+    quota is running low.
+    """
+
+    def __init__(self, logger: logging.Logger, min_interval: float = 0) -> None:
         """Initializes a new instance of a `YelpClient`.
 
         Args:
             logger (`logging.Logger`): An instance of a Python
                 standard logger.
 
+            min_interval (`float`): The minimum number of seconds to
+                wait after each request. Defaults to zero, in which
+                case requests are only paced when the daily quota
+                is running low.
+
         Raises:
             `RuntimeError` if an environment variable,
                 `YELP_API_KEY`, is not found.
@@ -91,12 +149,45 @@ class YelpClient(IPlacesProvider):
         try:
             self._api_key = os.environ["YELP_API_KEY"]
             self._logger = logger
+            self._min_interval = min_interval
         except KeyError as e:
             raise RuntimeError(
                 "Failed to initialize YelpClient."
                 f'Missing expected environment variable "{e}".'
             ) from None
 
+        # Initialize HTTP session to reuse pooled connections across requests
+        retries = Retry(
+            total=YelpClient.MAX_NUM_RETRIES,
+            backoff_factor=YelpClient.RETRY_BACKOFF_FACTOR,
+            backoff_jitter=YelpClient.RETRY_BACKOFF_JITTER,
+            backoff_max=YelpClient.RETRY_BACKOFF_MAX,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=32, pool_maxsize=32, max_retries=retries
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.headers.update(
+            {"Authorization": f"Bearer {self._api_key}"}
+        )
+
+        # Initialize bounded, least-recently-used cache of successfully-
+        # fetched pages of search results and registry of pages currently
+        # being fetched
+        self._page_cache: OrderedDict[Tuple, Dict] = OrderedDict()
+        self._inflight_pages: Dict[Tuple, Future] = {}
+        self._page_cache_lock = threading.Lock()
+
+        # Cap the number of requests in flight at once across threads
+        self._request_slots = threading.BoundedSemaphore(
+            YelpClient.MAX_NUM_CONCURRENT_REQUESTS
+        )
+
     def map_place(self, place: Dict) -> Place:
         """Maps a place fetched from a data source to a standard representation.
 
@@ -108,9 +199,12 @@ class YelpClient(IPlacesProvider):
         """
         id = place["id"]
         name = place["name"]
-        categories = "|".join(c["title"] for c in place["categories"])
-        aliases = "|".join(c["alias"] for c in place["categories"])
-        lat, lon = place["coordinates"].values()
+        place_categories = place["categories"]
+        categories = "|".join(c["title"] for c in place_categories)
+        aliases = "|".join(c["alias"] for c in place_categories)
+        coordinates = place["coordinates"]
+        lat = coordinates["latitude"]
+        lon = coordinates["longitude"]
         address = ", ".join(place["location"]["display_address"])
         is_closed = place["is_closed"]
         source = "yelp"
@@ -132,7 +226,9 @@ class YelpClient(IPlacesProvider):
     def find_places_in_bounding_box(
         self, box: BoundingBox, search_radius: int
     ) -> Tuple[List[Dict], List[Dict]]:
-        """Locates all POIs within the bounding box.
+        """Locates all POIs within the bounding box. The first page of
+        results is fetched to determine the total number of matches,
+        after which any remaining pages are requested concurrently.
 
         Args:
             box (`BoundingBox`): The bounding box.
@@ -146,73 +242,235 @@ class YelpClient(IPlacesProvider):
                 consisting of the list of retrieved places and a list
                 of any errors that occurred, respectively.
         """
-        # Initialize request URL and static params
-        url = "https://api.yelp.com/v3/businesses/search"
-        categories = ",".join(e.value for e in YelpPOICategories)
-        limit = YelpClient.MAX_NUM_PAGE_RESULTS
+        # Fetch first page of results, exiting processing for cell on error
+        data, error = self.search_page(box, search_radius, offset=0)
+        if error:
+            return [], [error]
 
-        # Issue POI query for minimum bounding circle circumscribing each box
-        # NOTE: Only integers are accepted for the radius.
+        # If number of POIs returned exceeds max, split box and recursively
+        # issue HTTP requests, dropping POIs found by more than one sub-cell
         pois = []
         errors = []
-        page_idx = 0
-        while True:
-            # Build request parameters and headers
-            params = {
-                "radius": math.ceil(search_radius),
-                "categories": categories,
-                "longitude": float(box.center.lon),
-                "latitude": float(box.center.lat),
-                "limit": limit,
-                "offset": page_idx * limit,
-            }
-            headers = {
-                "Authorization": f"Bearer {self._api_key}",
-            }
-
-            # Send request and parse JSON response
-            r = requests.get(url, headers=headers, params=params)
-            data = r.json()
-
-            # If error occurred, store information and exit processing for cell
-            if not r.ok:
-                self._logger.error(
-                    "Failed to retrieve POI data through the Yelp API. "
-                    f'Received a "{r.status_code}-{r.reason}" status code '
-                    f'with the message "{r.text}".'
+        if data["total"] > YelpClient.MAX_NUM_QUERY_RESULTS:
+            pois_by_id = {}
+            sub_cells = box.split_along_axes(x_into=2, y_into=2)
+            for sub in sub_cells:
+                sub_pois, sub_errs = self.find_places_in_bounding_box(
+                    sub, search_radius / 2
                 )
-                errors.append({"params": params, "error": data})
-                return pois, errors
-
-            # Otherwise, if number of POIs returned exceeds max, split
-            # box and recursively issue HTTP requests
-            if data["total"] > YelpClient.MAX_NUM_QUERY_RESULTS:
-                sub_cells = box.split_along_axes(x_into=2, y_into=2)
-                for sub in sub_cells:
-                    sub_pois, sub_errs = self.find_places_in_bounding_box(
-                        sub, search_radius / 4
-                    )
-                    pois.extend(sub_pois)
-                    errors.extend(sub_errs)
-                return pois, errors
-
-            # Otherwise, extract business data from response body JSON
-            page_pois = data.get("businesses", [])
-            for poi in page_pois:
-                pois.append(poi)
-
-            # Determine total number of pages of data for query
-            num_pages = (data["total"] // limit) + (
-                1 if data["total"] % limit > 0 else 0
+                for poi in sub_pois:
+                    pois_by_id.setdefault(poi["id"], poi)
+                errors.extend(sub_errs)
+            return list(pois_by_id.values()), errors
+
+        # Otherwise, extract business data from response body JSON
+        # and fetch any remaining pages planned from the first response
+        pois.extend(data.get("businesses", []))
+        page_pois, page_errors = self._fetch_remaining_pages(
+            box, search_radius, data["total"]
+        )
+        pois.extend(page_pois)
+        errors.extend(page_errors)
+
+        return pois, errors
+
+    def _fetch_remaining_pages(
+        self, box: BoundingBox, search_radius: int, total: int
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """Concurrently fetches every page of POIs after the first. The
+        page offsets are planned up front from the total number of
+        matches reported by the first page, capped at the maximum
+        number of results the API will return for a single query.
+
+        Args:
+            box (`BoundingBox`): The bounding box.
+
+            search_radius (`int`): The search radius.
+
+            total (`int`): The total number of matches reported
+                by the first page of results.
+
+        Returns:
+            ((`list` of `dict`, `list` of `dict`,)): A two-item tuple
+                consisting of the list of retrieved places and a list
+                of any errors that occurred, respectively.
+        """
+
+        # Define local function to fetch a later page
+        def fetch_page(offset: int) -> Tuple[Dict, Optional[Dict]]:
+            return self.search_page(box, search_radius, offset)
+
+        # Plan offsets for all remaining pages
+        offsets = range(
+            YelpClient.MAX_NUM_PAGE_RESULTS,
+            min(total, YelpClient.MAX_NUM_QUERY_RESULTS),
+            YelpClient.MAX_NUM_PAGE_RESULTS,
+        )
+
+        # Fetch pages concurrently
+        pois = []
+        errors = []
+        with ThreadPoolExecutor(
+            max_workers=YelpClient.MAX_NUM_CONCURRENT_REQUESTS
+        ) as executor:
+            for page_data, page_error in executor.map(fetch_page, offsets):
+                if page_error:
+                    errors.append(page_error)
+                else:
+                    pois.extend(page_data.get("businesses", []))
+
+        return pois, errors
+
+    def search_page(
+        self, box: BoundingBox, search_radius: int, offset: int
+    ) -> Tuple[Dict, Optional[Dict]]:
+        """Fetches a single page of POIs within the minimum bounding
+        circle circumscribing the bounding box.
+
+        Args:
+            box (`BoundingBox`): The bounding box.
+
+            search_radius (`int`): The search radius, in meters.
+
+            offset (`int`): The number of results to skip.
+
+        Returns:
+            ((`dict`, `dict` | `None`,)): A two-item tuple consisting
+                of the response body and any error that occurred,
+                respectively.
+        """
+        # Build request parameters
+        # NOTE: Only integers are accepted for the radius.
+        url = "https://api.yelp.com/v3/businesses/search"
+        params = {
+            "radius": math.ceil(search_radius),
+            "categories": YelpClient.CATEGORIES_PARAM,
+            "longitude": float(box.center.lon),
+            "latitude": float(box.center.lat),
+            "limit": YelpClient.MAX_NUM_PAGE_RESULTS,
+            "offset": offset,
+        }
+
+        # Return previously-fetched page for same search area, if it exists.
+        # Otherwise, if an identical request is already in flight on another
+        # thread, wait for its result rather than sending a duplicate.
+        cache_key = (
+            round(params["latitude"], 6),
+            round(params["longitude"], 6),
+            params["radius"],
+            offset,
+        )
+        with self._page_cache_lock:
+            if cache_key in self._page_cache:
+                self._page_cache.move_to_end(cache_key)
+                return self._page_cache[cache_key], None
+            inflight = self._inflight_pages.get(cache_key)
+            if inflight is None:
+                future = Future()
+                self._inflight_pages[cache_key] = future
+        if inflight is not None:
+            return inflight.result()
+
+        # Otherwise, fetch page and share outcome with any waiting threads
+        try:
+            data, error = self._request_page(url, params)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result((data, error))
+        finally:
+            with self._page_cache_lock:
+                del self._inflight_pages[cache_key]
+                if not future.exception() and not error:
+                    self._page_cache[cache_key] = data
+                    if len(self._page_cache) > YelpClient.MAX_NUM_CACHED_PAGES:
+                        self._page_cache.popitem(last=False)
+
+        return data, error
+
+    def _request_page(
+        self, url: str, params: Dict
+    ) -> Tuple[Dict, Optional[Dict]]:
+        """Sends a search request to the Yelp API.
+
+        Args:
+            url (`str`): The request URL.
+
+            params (`dict`): The query parameters.
+
+        Returns:
+            ((`dict`, `dict` | `None`,)): A two-item tuple consisting
+                of the response body and any error that occurred,
+                respectively.
+        """
+        # Send request, limiting the number in flight across all
+        # cells and pages. Transient failures are retried by the session,
+        # so an exception here means every attempt has been exhausted.
+        try:
+            with self._request_slots:
+                r = self._session.get(url, params=params)
+        except requests.exceptions.RequestException as e:
+            self._logger.error(
+                "Failed to retrieve POI data through the Yelp API after "
+                f"{YelpClient.MAX_NUM_RETRIES} retries. {e}"
+            )
+            return {}, {"params": params, "error": str(e)}
+
+        # Pace subsequent requests based on remaining quota
+        self._throttle(r)
+
+        # If error persisted after final retry, log and return information
+        if not r.ok:
+            self._logger.error(
+                "Failed to retrieve POI data through the Yelp API. "
+                f'Received a "{r.status_code}-{r.reason}" status code '
+                f'with the message "{r.text}".'
             )
+            return {}, {"params": params, "error": r.text}
+
+        # Otherwise, parse JSON response
+        try:
+            data = orjson.loads(r.content)
+        except orjson.JSONDecodeError as e:
+            self._logger.error(f"Failed to parse response body JSON. {e}")
+            return {}, {"params": params, "error": str(e)}
+
+        return data, None
+
+    def _throttle(self, r: requests.Response) -> None:
+        """Waits before the next request only when necessary. Rate-limited
+        (i.e., 429) responses are already retried by the session after the
+        delay given in their "Retry-After" header, so this only paces requests
+        once the daily quota reported in the "RateLimit-Remaining" header
+        runs low, or by the configured minimum interval.
+
+        Args:
+            r (`requests.Response`): The most recent response.
 
-            # Return POIs and errors if on last page
-            if page_idx == num_pages - 1:
-                return pois, errors
+        Returns:
+            `None`
+        """
+        # Parse remaining daily quota from response headers
+        try:
+            remaining = int(r.headers["RateLimit-Remaining"])
+        except (KeyError, ValueError):
+            remaining = None
+
+        # Determine delay
+        delay = self._min_interval
+        if (
+            remaining is not None
+            and remaining <= YelpClient.LOW_QUOTA_THRESHOLD
+        ):
+            self._logger.warning(
+                f"Only {remaining} Yelp API call(s) remain in the daily quota."
+            )
+            delay = max(delay, YelpClient.SECONDS_DELAY_LOW_QUOTA)
 
-            # Otherwise, iterate page index and add delay before next request
-            page_idx += 1
-            time.sleep(0.5)
+        # Wait if needed
+        if delay > 0:
+            time.sleep(delay)
 
     def run_nearby_search(
         self, geo: Union[Polygon, MultiPolygon]
@@ -282,20 +540,37 @@ class YelpClient(IPlacesProvider):
         # Divide box into grid of cells of approximately equal length and width
         # NOTE: Small size differences may exist due to rounding.
         cells: List[BoundingBox] = bbox.split_into_squares(
-            size_in_degrees=Decimal(str(max_side_degrees))
+            size_in_degrees=max_side_degrees
         )
 
-        # Locate POIs within each cell if it contains any part of geography
-        pois = []
+        # Define local function to locate POIs within a cell
+        def search_cell(cell: BoundingBox) -> Tuple[List[Dict], List[Dict]]:
+            return self.find_places_in_bounding_box(
+                box=cell,
+                search_radius=YelpClient.MAX_SEARCH_RADIUS_IN_METERS,
+            )
+
+        # Select cells that contain any part of geography by querying
+        # a spatial index of the geography's polygons in bulk
+        parts = list(geo.geoms) if isinstance(geo, MultiPolygon) else [geo]
+        tree = STRtree(parts)
+        hits = tree.query(
+            [cell.to_shapely() for cell in cells], predicate="intersects"
+        )
+        work = [cells[i] for i in sorted(set(hits[0]))]
+
+        # Locate POIs concurrently within each selected cell. Search
+        # circles of neighboring cells overlap, so POIs are keyed by id.
+        pois_by_id: Dict[str, Dict] = {}
         errors = []
-        for cell in cells:
-            if cell.intersects_with(geo):
-                cell_pois, cell_errs = self.find_places_in_bounding_box(
-                    box=cell,
-                    search_radius=YelpClient.MAX_SEARCH_RADIUS_IN_METERS,
-                )
-                pois.extend(cell_pois)
+        with ThreadPoolExecutor(
+            max_workers=YelpClient.MAX_NUM_CONCURRENT_CELLS
+        ) as executor:
+            for cell_pois, cell_errs in executor.map(search_cell, work):
+                for poi in cell_pois:
+                    pois_by_id.setdefault(poi["id"], poi)
                 errors.extend(cell_errs)
+        pois = list(pois_by_id.values())
 
         # Clean POIs
         cleaned_pois = self.clean_places(pois, geo)